@@ -99,11 +99,10 @@ class CalendarDrawer(TracksDrawer):
                 x_pos = offset.x + (day_offset + x) * cell_size + x * spacing.x
                 pos = (x_pos + 0.05 * cell_size, y_pos + 1.15 * cell_size)
                 dim = (cell_size * 0.9, cell_size * 0.9)
-                text_date = date.strftime("%Y-%m-%d")
-                if text_date in self.poster.tracks_by_date:
-                    tracks = self.poster.tracks_by_date[text_date]
-                    length = sum([t.length() for t in tracks])
-                    has_special = len([t for t in tracks if t.special]) > 0
+                ordinal = date.toordinal()
+                if ordinal in self.poster.tracks_by_date:
+                    length = self.poster.length_for_day(ordinal)
+                    has_special = self.poster.has_special_for_day(ordinal)
                     color = self.color(self.poster.length_range_by_date, length, has_special)
                     dr.add(dr.rect(pos, dim, fill=color))
                     dr.add(
@@ -16,7 +16,6 @@ import svgwrite  # type: ignore
 from gpxtrackposter.exceptions import PosterError
 from gpxtrackposter.localization import localized_month_name
 from gpxtrackposter.poster import Poster
-from gpxtrackposter.track import Track
 from gpxtrackposter.tracks_drawer import TracksDrawer
 from gpxtrackposter.units import Units
 from gpxtrackposter.value_range import ValueRange
@@ -121,7 +120,7 @@ class CircularDrawer(TracksDrawer):
         day = 0
         date = datetime.date(year, 1, 1)
         while date.year == year:
-            text_date = date.strftime("%Y-%m-%d")
+            ordinal = date.toordinal()
             a1 = math.radians(day * df)
             a2 = math.radians((day + 1) * df)
             if date.day == 1:
@@ -158,10 +157,10 @@ class CircularDrawer(TracksDrawer):
                 )
                 text.add(tpath)
                 dr.add(text)
-            if text_date in self.poster.tracks_by_date:
+            if ordinal in self.poster.tracks_by_date:
                 self._draw_circle_segment(
                     dr,
-                    self.poster.tracks_by_date[text_date],
+                    ordinal,
                     a1,
                     a2,
                     radius_range,
@@ -214,14 +213,14 @@ class CircularDrawer(TracksDrawer):
     def _draw_circle_segment(
         self,
         dr: svgwrite.Drawing,
-        tracks: typing.List[Track],
+        ordinal: int,
         a1: float,
         a2: float,
         rr: ValueRange,
         center: XY,
     ) -> None:
-        length = sum([t.length() for t in tracks])
-        has_special = len([t for t in tracks if t.special]) > 0
+        length = self.poster.length_for_day(ordinal)
+        has_special = self.poster.has_special_for_day(ordinal)
         color = self.color(self.poster.length_range_by_date, length, has_special)
         max_length = self.poster.length_range_by_date.upper()
         assert max_length is not None
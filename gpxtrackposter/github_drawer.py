@@ -97,9 +97,9 @@ class GithubDrawer(TracksDrawer):
                     rect_y += 3.5
                     color = "#444444"
                     date_title = str(github_rect_day)
-                    if date_title in self.poster.tracks_by_date:
-                        tracks = self.poster.tracks_by_date[date_title]
-                        length = sum([t.length() for t in tracks])
+                    ordinal = github_rect_day.toordinal()
+                    if ordinal in self.poster.tracks_by_date:
+                        length = self.poster.length_for_day(ordinal)
                         distance1 = self.poster.special_distance["special_distance"]
                         distance2 = self.poster.special_distance["special_distance2"]
                         has_special = distance1 < length < distance2
@@ -5,15 +5,18 @@
 # license that can be found in the LICENSE file.
 
 from collections import defaultdict
+import datetime
 import gettext
 import locale
 import typing
 
+import numpy as np
 import pint  # type: ignore
 import svgwrite  # type: ignore
 
 from gpxtrackposter.quantity_range import QuantityRange
 from gpxtrackposter.track import Track
+from gpxtrackposter.tracks_by_date import TracksByDate
 from gpxtrackposter.units import Units
 from gpxtrackposter.utils import format_float
 from gpxtrackposter.xy import XY
@@ -24,13 +27,54 @@ if typing.TYPE_CHECKING:
     from gpxtrackposter.tracks_drawer import TracksDrawer  # pylint: disable=cyclic-import
 
 
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+def _iso_weeks(ordinals: np.ndarray) -> np.ndarray:
+    """Return the ISO week numbers of the days with the given date ordinals.
+
+    The ISO week of a day is the week containing its Thursday; its number is the (0-based) day of year
+    of that Thursday divided by 7, plus 1.
+    """
+    weekdays = (ordinals + 6) % 7  # Monday = 0 (ordinal 1, i.e. 0001-01-01, is a Monday)
+    thursdays = (ordinals - weekdays + 3 - _EPOCH_ORDINAL).astype("datetime64[D]")
+    year_starts = thursdays.astype("datetime64[Y]").astype("datetime64[D]")
+    return (thursdays - year_starts).astype(np.int64) // 7 + 1
+
+
+class _TrackData(typing.NamedTuple):
+    """Per-track and per-day values computed from a set of tracks, see Poster._aggregate_tracks()"""
+
+    # tracks grouped by day, see TracksByDate
+    order: np.ndarray
+    day_ordinals: np.ndarray
+    day_indptr: np.ndarray
+    # per-day total lengths (in meters) and special flags, indexed by "date ordinal - day_offset"
+    day_offset: int
+    day_lengths: np.ndarray
+    day_special: np.ndarray
+    # track lengths (in meters)
+    lengths: np.ndarray
+    # sorted unique years of the tracks, and the total length (in meters) of each year
+    years: np.ndarray
+    year_lengths: np.ndarray
+    # number of unique (year, week) pairs
+    week_count: int
+
+
+def _start_ordinal(t: Track) -> int:
+    """Return the date ordinal of the track's start time."""
+    assert t.start_time is not None
+    return t.start_time.toordinal()
+
+
 class Poster:
     """Create a poster from track data.
 
     Attributes:
         athlete: Name of athlete to be displayed on poster.
         title: Title of poster.
-        tracks_by_date: Tracks organized temporally if needed.
+        tracks_by_date: Tracks organized temporally if needed (keyed by date ordinal).
         tracks: List of tracks to be used in the poster.
         length_range: Range of lengths of tracks in poster.
         length_range_by_date: Range of lengths organized temporally.
@@ -44,19 +88,63 @@ class Poster:
     Methods:
         set_tracks: Associate the Poster with a set of tracks
         draw: Draw the tracks on the poster.
+        length_for_day: Total length of the tracks of a day, given by its date ordinal
+        has_special_for_day: If any track of a day, given by its date ordinal, is special
         m2u: Convert meters to kilometers or miles based on units
         u: Return distance unit (km or mi)
     """
 
+    __slots__ = (
+        "_athlete",
+        "_title",
+        "_tracks_by_date",
+        "_day_lengths",
+        "_day_special",
+        "_day_offset",
+        "tracks",
+        "length_range",
+        "length_range_by_date",
+        "total_length_year_dict",
+        "_stats",
+        "_units",
+        "_length_unit",
+        "_unit_suffix",
+        "colors",
+        "special_distance",
+        "width",
+        "height",
+        "years",
+        "tracks_drawer",
+        "_trans",
+    )
+
+    # styles of the header and footer texts, referenced via their CSS class
+    _CSS = (
+        ".title{font-size:12px;font-family:Arial;font-weight:bold}"
+        ".hdr{font-size:4px;font-family:Arial}"
+        ".val{font-size:9px;font-family:Arial}"
+        ".sv{font-size:3px;font-family:Arial}"
+    )
+
     def __init__(self) -> None:
         self._athlete: typing.Optional[str] = None
         self._title: typing.Optional[str] = None
-        self.tracks_by_date: typing.Dict[str, typing.List[Track]] = defaultdict(list)
+        self._tracks_by_date = TracksByDate()
+        self._day_lengths: np.ndarray = np.zeros(0)
+        self._day_special: np.ndarray = np.zeros(0, dtype=bool)
+        self._day_offset: int = 0
         self.tracks: typing.List[Track] = []
         self.length_range = QuantityRange()
         self.length_range_by_date = QuantityRange()
         self.total_length_year_dict: typing.Dict[int, pint.quantity.Quantity] = defaultdict(int)
-        self.units = "metric"
+        self._stats: typing.Tuple[pint.quantity.Quantity, pint.quantity.Quantity, int] = (
+            0.0 * Units().meter,
+            0.0 * Units().meter,
+            0,
+        )
+        self._units = "metric"
+        self._length_unit = Units().km
+        self._unit_suffix = "km"
         self.colors = {
             "background": "#222222",
             "text": "#FFFFFF",
@@ -71,6 +159,19 @@ class Poster:
         self._trans: typing.Optional[typing.Callable[[str], str]] = None
         self.set_language(None)
 
+    @property
+    def units(self) -> str:
+        return self._units
+
+    @units.setter
+    def units(self, units: str) -> None:
+        self._units = units
+        self._length_unit = Units().km if units == "metric" else Units().mile
+        self._update_unit_suffix()
+
+    def _update_unit_suffix(self) -> None:
+        self._unit_suffix = self.translate("km" if self._units == "metric" else "mi")
+
     def set_language(self, language: typing.Optional[str]) -> None:
         if language:
             try:
@@ -85,6 +186,7 @@ class Poster:
         else:
             lang = gettext.NullTranslations()
         self._trans = lang.gettext
+        self._update_unit_suffix()
 
     def translate(self, s: str) -> str:
         if self._trans is None:
@@ -97,6 +199,10 @@ class Poster:
     def set_title(self, title: str) -> None:
         self._title = title
 
+    @property
+    def tracks_by_date(self) -> TracksByDate:
+        return self._tracks_by_date
+
     def set_tracks(self, tracks: typing.List[Track]) -> None:
         """Associate the set of tracks with this poster.
 
@@ -104,43 +210,107 @@ class Poster:
         based on this set of tracks.
         """
         self.tracks = tracks
-        self.tracks_by_date.clear()
+        self._tracks_by_date = TracksByDate()
+        self._day_lengths = np.zeros(0)
+        self._day_special = np.zeros(0, dtype=bool)
+        self._day_offset = 0
+        self.years.clear()
         self.length_range.clear()
         self.length_range_by_date.clear()
-        self._compute_years(tracks)
-        for track in tracks:
-            assert track.start_time is not None
-            if not self.years.contains(track.start_time):
-                continue
-            text_date = track.start_time.strftime("%Y-%m-%d")
-            self.tracks_by_date[text_date].append(track)
-            self.length_range.extend(track.length())
-        for date_tracks in self.tracks_by_date.values():
-            length = sum([t.length() for t in date_tracks])
-            self.length_range_by_date.extend(length)
+        self.total_length_year_dict.clear()
+        self._stats = (0.0 * Units().meter, 0.0 * Units().meter, 0)
+        if not tracks:
+            return
+
+        data = self._aggregate_tracks(tracks)
+        self.years.add_years(data.years)
+        self._tracks_by_date = TracksByDate(tracks, data.order, data.day_ordinals, data.day_indptr)
+        self._day_offset = data.day_offset
+        self._day_lengths = data.day_lengths
+        self._day_special = data.day_special
+
+        meter = Units().meter
+        self.length_range.extend_array(data.lengths * meter)
+        self.length_range_by_date.extend_array(self._day_lengths[data.day_ordinals - self._day_offset] * meter)
+        for year, year_length in zip(data.years, data.year_lengths):
+            self.total_length_year_dict[int(year)] = float(year_length) * meter
+        total_length = float(data.lengths.sum()) * meter
+        self._stats = (total_length, total_length / len(data.lengths), data.week_count)
+
+    @staticmethod
+    def _aggregate_tracks(tracks: typing.List[Track]) -> _TrackData:
+        """Compute all per-track and per-day values needed by the Poster.
+
+        The tracks are only touched to extract their date ordinals, lengths and special flags;
+        everything else (including the track years) is derived from these arrays.
+        """
+        n = len(tracks)
+        ordinals = np.fromiter((_start_ordinal(t) for t in tracks), dtype=np.int64, count=n)
+        lengths = np.fromiter((t.length_meters() for t in tracks), dtype=np.float64, count=n)
+        special = np.fromiter((t.special for t in tracks), dtype=bool, count=n)
+        dates = (ordinals - _EPOCH_ORDINAL).astype("datetime64[D]")
+        years = dates.astype("datetime64[Y]").astype(np.int64) + 1970
+        weeks = _iso_weeks(ordinals)
+
+        # group the tracks by day: sort by date ordinal, then split at every change of the ordinal
+        order = np.argsort(ordinals, kind="stable")
+        sorted_ordinals = ordinals[order]
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(sorted_ordinals)) + 1))
+
+        # per-day total lengths and special flags, indexed by "date ordinal - first date ordinal"
+        day_offset = int(sorted_ordinals[0])
+        day_lengths = np.zeros(int(sorted_ordinals[-1]) - day_offset + 1)
+        np.add.at(day_lengths, ordinals - day_offset, lengths)
+        day_special = np.zeros(len(day_lengths), dtype=bool)
+        day_special[ordinals[special] - day_offset] = True
+
+        # statistics shown in the footer; number of weeks = number of unique (year, week) pairs
+        unique_years, year_index = np.unique(years, return_inverse=True)
+        return _TrackData(
+            order=order,
+            day_ordinals=sorted_ordinals[starts],
+            day_indptr=np.append(starts, n),
+            day_offset=day_offset,
+            day_lengths=day_lengths,
+            day_special=day_special,
+            lengths=lengths,
+            years=unique_years,
+            year_lengths=np.bincount(year_index, weights=lengths),
+            week_count=len(np.unique(years * 64 + weeks)),
+        )
+
+    def length_for_day(self, ordinal: int) -> pint.quantity.Quantity:
+        """Return the total length of all tracks started on the day with the given date ordinal."""
+        i = ordinal - self._day_offset
+        if 0 <= i < len(self._day_lengths):
+            return float(self._day_lengths[i]) * Units().meter
+        return 0.0 * Units().meter
+
+    def has_special_for_day(self, ordinal: int) -> bool:
+        """Return True if any track started on the day with the given date ordinal is special."""
+        i = ordinal - self._day_offset
+        return 0 <= i < len(self._day_special) and bool(self._day_special[i])
 
     def draw(self, drawer: "TracksDrawer", output: str) -> None:
         """Set the Poster's drawer and draw the tracks."""
         self.tracks_drawer = drawer
         d = svgwrite.Drawing(output, (f"{self.width}mm", f"{self.height}mm"))
         d.viewbox(0, 0, self.width, self.height)
+        d.defs.add(d.style(self._CSS))
         d.add(d.rect((0, 0), (self.width, self.height), fill=self.colors["background"]))
-        self._draw_header(d)
-        self._draw_footer(d)
+        text_color = self.colors["text"]
+        self._draw_header(d, text_color)
+        self._draw_footer(d, text_color)
         self._draw_tracks(d, XY(self.width - 20, self.height - 30 - 30), XY(10, 30))
         d.save()
 
     def m2u(self, m: pint.quantity.Quantity) -> float:
         """Convert meters to kilometers or miles, according to units."""
-        if self.units == "metric":
-            return m.m_as(Units().km)
-        return m.m_as(Units().mile)
+        return m.m_as(self._length_unit)
 
     def u(self) -> str:
         """Return the unit of distance being used on the Poster."""
-        if self.units == "metric":
-            return self.translate("km")
-        return self.translate("mi")
+        return self._unit_suffix
 
     def format_distance(self, d: pint.quantity.Quantity) -> str:
         """Formats a distance using the locale specific float format and the selected unit."""
@@ -150,18 +320,13 @@ class Poster:
         assert self.tracks_drawer
         self.tracks_drawer.draw(d, size, offset)
 
-    def _draw_header(self, d: svgwrite.Drawing) -> None:
-        text_color = self.colors["text"]
-        title_style = "font-size:12px; font-family:Arial; font-weight:bold;"
+    def _draw_header(self, d: svgwrite.Drawing, text_color: str) -> None:
         assert self._title is not None
-        d.add(d.text(self._title, insert=(10, 20), fill=text_color, style=title_style))
-
-    def _draw_footer(self, d: svgwrite.Drawing) -> None:
-        text_color = self.colors["text"]
-        header_style = "font-size:4px; font-family:Arial"
-        value_style = "font-size:9px; font-family:Arial"
-        small_value_style = "font-size:3px; font-family:Arial"
+        g = d.g(class_="header", fill=text_color)
+        g.add(d.text(self._title, insert=(10, 20), class_="title"))
+        d.add(g)
 
+    def _draw_footer(self, d: svgwrite.Drawing, text_color: str) -> None:
         (
             total_length,
             average_length,
@@ -169,60 +334,64 @@ class Poster:
             weeks,
         ) = self._compute_track_statistics()
 
-        d.add(
+        g = d.g(class_="footer", fill=text_color)
+        g.add(
             d.text(
                 self.translate("ATHLETE"),
                 insert=(10, self.height - 20),
-                fill=text_color,
-                style=header_style,
+                class_="hdr",
             )
         )
-        d.add(
+        g.add(
             d.text(
                 self._athlete,
                 insert=(10, self.height - 10),
-                fill=text_color,
-                style=value_style,
+                class_="val",
             )
         )
-        d.add(
+        g.add(
             d.text(
                 self.translate("STATISTICS"),
                 insert=(120, self.height - 20),
-                fill=text_color,
-                style=header_style,
+                class_="hdr",
             )
         )
-        d.add(
+        if not self.tracks:
+            g.add(
+                d.text(
+                    self.translate("No tracks"),
+                    insert=(120, self.height - 15),
+                    class_="sv",
+                )
+            )
+            d.add(g)
+            return
+        g.add(
             d.text(
                 self.translate("Number") + f": {len(self.tracks)}",
                 insert=(120, self.height - 15),
-                fill=text_color,
-                style=small_value_style,
+                class_="sv",
             )
         )
-        d.add(
+        g.add(
             d.text(
                 self.translate("Weekly") + ": " + format_float(len(self.tracks) / weeks),
                 insert=(120, self.height - 10),
-                fill=text_color,
-                style=small_value_style,
+                class_="sv",
             )
         )
-        d.add(
+        g.add(
             d.text(
                 self.translate("Total") + ": " + self.format_distance(total_length),
                 insert=(141, self.height - 15),
-                fill=text_color,
-                style=small_value_style,
+                class_="sv",
             )
         )
-        d.add(
+        g.add(
             d.text(
                 self.translate("Avg") + ": " + self.format_distance(average_length),
                 insert=(141, self.height - 10),
-                fill=text_color,
-                style=small_value_style,
+                class_="sv",
             )
         )
         if length_range.is_valid():
@@ -231,48 +400,26 @@ class Poster:
             assert min_length is not None
             assert max_length is not None
         else:
-            min_length = 0.0
-            max_length = 0.0
-        d.add(
+            min_length = 0.0 * Units().meter
+            max_length = 0.0 * Units().meter
+        g.add(
             d.text(
                 self.translate("Min") + ": " + self.format_distance(min_length),
                 insert=(167, self.height - 15),
-                fill=text_color,
-                style=small_value_style,
+                class_="sv",
             )
         )
-        d.add(
+        g.add(
             d.text(
                 self.translate("Max") + ": " + self.format_distance(max_length),
                 insert=(167, self.height - 10),
-                fill=text_color,
-                style=small_value_style,
+                class_="sv",
             )
         )
+        d.add(g)
 
     def _compute_track_statistics(
         self,
     ) -> typing.Tuple[pint.quantity.Quantity, pint.quantity.Quantity, QuantityRange, int]:
-        length_range = QuantityRange()
-        total_length = 0.0 * Units().meter
-        self.total_length_year_dict.clear()
-        weeks = {}
-        for t in self.tracks:
-            assert t.start_time is not None
-            total_length += t.length()
-            self.total_length_year_dict[t.start_time.year] += t.length()
-            length_range.extend(t.length())
-            # time.isocalendar()[1] -> week number
-            weeks[(t.start_time.year, t.start_time.isocalendar()[1])] = 1
-        return (
-            total_length,
-            total_length / len(self.tracks),
-            length_range,
-            len(weeks),
-        )
-
-    def _compute_years(self, tracks: typing.List[Track]) -> None:
-        self.years.clear()
-        for t in tracks:
-            assert t.start_time is not None
-            self.years.add(t.start_time)
+        total_length, average_length, weeks = self._stats
+        return total_length, average_length, self.length_range, weeks
@@ -58,6 +58,12 @@ class QuantityRange:
             self._lower = min(self._lower, value)
             self._upper = max(self._upper, value)
 
+    def extend_array(self, values: pint.quantity.Quantity) -> None:
+        if values.magnitude.size == 0:
+            return
+        self.extend(values.min())
+        self.extend(values.max())
+
     def interpolate(self, relative: float) -> pint.quantity.Quantity:
         if not self.is_valid():
             raise ValueError("Cannot interpolate invalid QuantityRange")
@@ -0,0 +1,62 @@
+"""Read-only mapping from date ordinals to the tracks started on that date"""
+# Copyright 2020 Florian Pigorsch & Contributors. All rights reserved.
+#
+# Use of this source code is governed by a MIT-style
+# license that can be found in the LICENSE file.
+
+import typing
+
+import numpy as np
+
+from gpxtrackposter.track import Track
+
+
+class TracksByDate(typing.Mapping[int, typing.List[Track]]):
+    """Read-only mapping from date ordinals (see date.toordinal()) to the tracks started on that date
+
+    The tracks are not copied into per-day lists; instead the mapping keeps the sorted unique date
+    ordinals of all days and, in CSR style, an index pointer into the date-sorted track order. The
+    list for a given date is only built when it is looked up.
+
+    Attributes:
+        _tracks: All tracks (in their original order).
+        _order: Indices into _tracks (of the tracks to be included), sorted by date.
+        _ordinals: Sorted unique date ordinals of the days having tracks.
+        _indptr: Tracks of day _ordinals[i] are _order[_indptr[i]:_indptr[i + 1]].
+    """
+
+    def __init__(
+        self,
+        tracks: typing.Optional[typing.List[Track]] = None,
+        order: typing.Optional[np.ndarray] = None,
+        ordinals: typing.Optional[np.ndarray] = None,
+        indptr: typing.Optional[np.ndarray] = None,
+    ) -> None:
+        self._tracks: typing.List[Track] = tracks if tracks is not None else []
+        self._order = order if order is not None else np.zeros(0, dtype=np.int64)
+        self._ordinals = ordinals if ordinals is not None else np.zeros(0, dtype=np.int64)
+        self._indptr = indptr if indptr is not None else np.zeros(1, dtype=np.int64)
+
+    def _index(self, key: object) -> typing.Optional[int]:
+        if not isinstance(key, (int, np.integer)):
+            return None
+        i = int(np.searchsorted(self._ordinals, key))
+        if i < len(self._ordinals) and self._ordinals[i] == key:
+            return i
+        return None
+
+    def __getitem__(self, key: int) -> typing.List[Track]:
+        i = self._index(key)
+        if i is None:
+            raise KeyError(key)
+        return [self._tracks[j] for j in self._order[self._indptr[i] : self._indptr[i + 1]]]
+
+    def __contains__(self, key: object) -> bool:
+        return self._index(key) is not None
+
+    def __iter__(self) -> typing.Iterator[int]:
+        for ordinal in self._ordinals:
+            yield int(ordinal)
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
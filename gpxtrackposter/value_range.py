@@ -6,6 +6,8 @@
 
 import typing
 
+import numpy as np
+
 
 class ValueRange:
     """Represent a range of numerical values.
@@ -22,6 +24,7 @@ class ValueRange:
         diameter: Return difference between upper and lower bounds if valid, else 0.
         contains: Returns True if the range contains value.
         extend: Adjust the range to include value.
+        extend_array: Adjust the range to include all values of an array.
 
     """
 
@@ -74,6 +77,12 @@ class ValueRange:
             self._lower = min(self._lower, value)
             self._upper = max(self._upper, value)
 
+    def extend_array(self, values: np.ndarray) -> None:
+        if values.size == 0:
+            return
+        self.extend(float(values.min()))
+        self.extend(float(values.max()))
+
     def interpolate(self, relative: float) -> float:
         if not self.is_valid():
             raise ValueError("Cannot interpolate invalid ValueRange")
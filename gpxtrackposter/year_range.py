@@ -5,9 +5,10 @@
 # license that can be found in the LICENSE file.
 
 import datetime
-import re
 import typing
 
+import numpy as np
+
 
 class YearRange:
     """Represent a range of years, with ability to update based on a track
@@ -19,10 +20,13 @@ class YearRange:
     Methods:
         parse: Parse a string into lower and upper bounds
         add: Adjust bounds based on a track
+        add_years: Adjust bounds based on an array of years
         contains: If track is contained in the range
         count: Number of years in range
     """
 
+    __slots__ = ("from_year", "to_year")
+
     def __init__(self) -> None:
         """Inits YearRange with empty bounds -- to be built after init"""
         self.from_year: typing.Optional[int] = None
@@ -45,14 +49,13 @@ class YearRange:
             self.from_year = None
             self.to_year = None
             return True
-        m = re.match(r"^\d+$", s)
-        if m:
-            self.from_year = int(s)
+        parts = s.split("-")
+        if len(parts) == 1 and parts[0].isdecimal():
+            self.from_year = int(parts[0])
             self.to_year = self.from_year
             return True
-        m = re.match(r"^(\d+)-(\d+)$", s)
-        if m:
-            y1, y2 = int(m.group(1)), int(m.group(2))
+        if len(parts) == 2 and parts[0].isdecimal() and parts[1].isdecimal():
+            y1, y2 = int(parts[0]), int(parts[1])
             if y1 <= y2:
                 self.from_year = y1
                 self.to_year = y2
@@ -65,39 +68,46 @@ class YearRange:
 
     def add(self, t: datetime.datetime) -> None:
         """For the given t, update from_year and to_year to include that timestamp"""
-        if self.from_year is None:
+        if self.from_year is None or self.to_year is None:
             self.from_year = t.year
             self.to_year = t.year
             return
 
-        assert self.from_year is not None
-        assert self.to_year is not None
         if t.year < self.from_year:
             self.from_year = t.year
         elif t.year > self.to_year:
             self.to_year = t.year
 
+    def add_years(self, years: np.ndarray) -> None:
+        """Update from_year and to_year to include all the given years"""
+        if years.size == 0:
+            return
+        lo, hi = int(years.min()), int(years.max())
+        if self.from_year is None or self.to_year is None:
+            self.from_year = lo
+            self.to_year = hi
+            return
+
+        self.from_year = min(self.from_year, lo)
+        self.to_year = max(self.to_year, hi)
+
     def contains(self, t: datetime.datetime) -> bool:
         """Return True if current year range contains t, False if not"""
-        if self.from_year is None:
+        if self.from_year is None or self.to_year is None:
             return True
 
-        assert self.from_year is not None
-        assert self.to_year is not None
         return self.from_year <= t.year <= self.to_year
 
     def count(self) -> int:
         """Return number of years contained in the current range"""
-        if self.from_year is None:
+        if self.from_year is None or self.to_year is None:
             return 0
 
-        assert self.to_year is not None
         return 1 + self.to_year - self.from_year
 
     def iter(self) -> typing.Generator[int, None, None]:
-        if self.from_year is None:
+        if self.from_year is None or self.to_year is None:
             return
 
-        assert self.to_year is not None
         for year in range(self.from_year, self.to_year + 1):
             yield year
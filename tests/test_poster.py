@@ -0,0 +1,122 @@
+# Copyright 2020 Florian Pigorsch & Contributors. All rights reserved.
+#
+# Use of this source code is governed by a MIT-style
+# license that can be found in the LICENSE file.
+
+import datetime
+import pathlib
+import typing
+
+import pint  # type: ignore
+
+from gpxtrackposter.poster import Poster
+from gpxtrackposter.track import Track
+from gpxtrackposter.tracks_drawer import TracksDrawer
+
+
+def _track(start: str, length_meters: float) -> Track:
+    t = Track()
+    t.start_time = datetime.datetime.strptime(start, "%Y-%m-%d %H:%M")
+    t.end_time = t.start_time
+    t._length_meters = length_meters  # pylint: disable=protected-access
+    return t
+
+
+def _meters(q: typing.Optional[pint.quantity.Quantity]) -> float:
+    assert q is not None
+    return q.m_as("m")
+
+
+def _poster(tracks: typing.List[Track]) -> Poster:
+    p = Poster()
+    p.set_tracks(tracks)
+    return p
+
+
+def test_set_tracks_groups_by_date() -> None:
+    p = _poster(
+        [
+            _track("2020-05-02 18:00", 3000),
+            _track("2020-05-01 08:00", 5000),
+            _track("2020-05-02 07:00", 2000),
+            _track("2019-12-31 10:00", 10000),
+        ]
+    )
+    assert list(p.tracks_by_date.keys()) == [
+        datetime.date(2019, 12, 31).toordinal(),
+        datetime.date(2020, 5, 1).toordinal(),
+        datetime.date(2020, 5, 2).toordinal(),
+    ]
+    assert [t.length_meters() for t in p.tracks_by_date[datetime.date(2020, 5, 2).toordinal()]] == [3000, 2000]
+
+    assert _meters(p.length_range.lower()) == 2000
+    assert _meters(p.length_range.upper()) == 10000
+    assert _meters(p.length_range_by_date.lower()) == 5000
+    assert _meters(p.length_range_by_date.upper()) == 10000
+
+
+def test_set_tracks_empty() -> None:
+    p = _poster([])
+    assert not p.tracks_by_date
+    assert not p.length_range.is_valid()
+    assert not p.length_range_by_date.is_valid()
+
+
+def test_length_for_day() -> None:
+    p = _poster([_track("2020-05-02 18:00", 3000), _track("2020-05-02 07:00", 2000), _track("2020-05-04 10:00", 1000)])
+    assert _meters(p.length_for_day(datetime.date(2020, 5, 2).toordinal())) == 5000
+    assert _meters(p.length_for_day(datetime.date(2020, 5, 3).toordinal())) == 0
+    assert _meters(p.length_for_day(datetime.date(2020, 5, 4).toordinal())) == 1000
+    assert _meters(p.length_for_day(datetime.date(2021, 1, 1).toordinal())) == 0
+    assert datetime.date(2020, 5, 3).toordinal() not in p.tracks_by_date
+    assert datetime.date(2020, 5, 4).toordinal() in p.tracks_by_date
+
+
+def test_has_special_for_day() -> None:
+    tracks = [_track("2020-05-02 18:00", 3000), _track("2020-05-02 07:00", 2000), _track("2020-05-04 10:00", 1000)]
+    tracks[1].special = True
+    p = _poster(tracks)
+    assert p.has_special_for_day(datetime.date(2020, 5, 2).toordinal())
+    assert not p.has_special_for_day(datetime.date(2020, 5, 3).toordinal())
+    assert not p.has_special_for_day(datetime.date(2020, 5, 4).toordinal())
+    assert not p.has_special_for_day(datetime.date(2021, 1, 1).toordinal())
+
+
+def test_units() -> None:
+    p = Poster()
+    length = _track("2020-05-02 18:00", 1609.344).length()
+    assert p.u() == "km"
+    assert abs(p.m2u(length) - 1.609344) < 1e-9
+    p.units = "imperial"
+    assert p.u() == "mi"
+    assert abs(p.m2u(length) - 1.0) < 1e-9
+    assert p.format_distance(length).endswith(" mi")
+
+
+def test_track_statistics() -> None:
+    p = _poster(
+        [
+            _track("2019-12-30 10:00", 1000),
+            _track("2020-01-02 10:00", 2000),
+            _track("2020-01-06 10:00", 6000),
+        ]
+    )
+    # pylint: disable=protected-access
+    total_length, average_length, length_range, weeks = p._compute_track_statistics()
+    assert _meters(total_length) == 9000
+    assert _meters(average_length) == 3000
+    assert _meters(length_range.lower()) == 1000
+    assert weeks == 3
+    assert _meters(p.total_length_year_dict[2019]) == 1000
+    assert _meters(p.total_length_year_dict[2020]) == 8000
+
+
+def test_draw_without_tracks(tmp_path: pathlib.Path) -> None:
+    p = _poster([])
+    p.set_title("Title")
+    p.set_athlete("Athlete")
+    output = tmp_path / "poster.svg"
+    p.draw(TracksDrawer(p), str(output))
+    svg = output.read_text()
+    assert "No tracks" in svg
+    assert "Weekly" not in svg
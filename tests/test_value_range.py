@@ -0,0 +1,19 @@
+# Copyright 2020 Florian Pigorsch & Contributors. All rights reserved.
+#
+# Use of this source code is governed by a MIT-style
+# license that can be found in the LICENSE file.
+
+import numpy as np
+
+from gpxtrackposter.value_range import ValueRange
+
+
+def test_extend_array() -> None:
+    r = ValueRange()
+    r.extend_array(np.array([]))
+    assert not r.is_valid()
+
+    r.extend_array(np.array([3.0, -1.0, 2.0]))
+    assert (r.lower(), r.upper()) == (-1.0, 3.0)
+    r.extend_array(np.array([0.0, 5.0]))
+    assert (r.lower(), r.upper()) == (-1.0, 5.0)
@@ -0,0 +1,33 @@
+# Copyright 2020 Florian Pigorsch & Contributors. All rights reserved.
+#
+# Use of this source code is governed by a MIT-style
+# license that can be found in the LICENSE file.
+
+import numpy as np
+
+from gpxtrackposter.year_range import YearRange
+
+
+def test_add_years() -> None:
+    yr = YearRange()
+    yr.add_years(np.array([], dtype=np.int16))
+    assert yr.from_year is None
+
+    yr.add_years(np.array([2018, 2016, 2017], dtype=np.int16))
+    assert (yr.from_year, yr.to_year) == (2016, 2018)
+    yr.add_years(np.array([2020], dtype=np.int16))
+    assert (yr.from_year, yr.to_year) == (2016, 2020)
+    assert yr.count() == 5
+
+
+def test_parse() -> None:
+    yr = YearRange()
+    assert yr.parse("2016")
+    assert (yr.from_year, yr.to_year) == (2016, 2016)
+    assert yr.parse("2016-2018")
+    assert (yr.from_year, yr.to_year) == (2016, 2018)
+    assert yr.parse("all")
+    assert (yr.from_year, yr.to_year) == (None, None)
+
+    for bad in ["", "-", "2018-2016", "2016-", "-2016", "2016-2017-2018", "20x6", " 2016", "+2016"]:
+        assert not yr.parse(bad)